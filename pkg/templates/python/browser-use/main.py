@@ -1,3 +1,7 @@
+import asyncio
+import logging
+import os
+import sys
 from typing import TypedDict
 
 import kernel
@@ -5,6 +9,20 @@ from browser_use import Agent, Browser
 from browser_use.llm import ChatOpenAI
 from kernel import Kernel
 
+# Use uvloop for the event loop Kernel creates when running this action, if available.
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# Log to stdout so messages show up in `kernel logs`. Only this module logs at
+# INFO; the root logger stays at WARNING so SDK request logs (httpx) stay quiet.
+logging.basicConfig(format="%(message)s", stream=sys.stdout)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
 client = Kernel()
 
 app = kernel.App("python-bu")
@@ -16,9 +34,20 @@ class TaskInput(TypedDict):
 
 # LLM API Keys are set in the environment during `kernel deploy <filename> -e OPENAI_API_KEY=XXX`
 # See https://onkernel.com/docs/launch/deploy#environment-variables
+if not os.getenv("OPENAI_API_KEY"):
+    raise ValueError("OPENAI_API_KEY is not set")
+
 llm = ChatOpenAI(model="gpt-4.1")
 
 
+def _use_eager_tasks() -> None:
+    """Run new tasks eagerly up to their first await (Python 3.12+ only)."""
+    factory = getattr(asyncio, "eager_task_factory", None)
+    loop = asyncio.get_running_loop()
+    if factory is not None and loop.get_task_factory() is None:
+        loop.set_task_factory(factory)
+
+
 @app.action("bu-task")
 async def bu_task(ctx: kernel.KernelContext, input_data: TaskInput):
     """
@@ -32,10 +61,14 @@ async def bu_task(ctx: kernel.KernelContext, input_data: TaskInput):
         An object with final_result and errors properties
     """
 
-    kernel_browser = client.browsers.create(
-        invocation_id=ctx.invocation_id, stealth=True
+    _use_eager_tasks()
+
+    kernel_browser = await asyncio.to_thread(
+        client.browsers.create, invocation_id=ctx.invocation_id, stealth=True
+    )
+    logger.info(
+        "Kernel browser live view url: %s", kernel_browser.browser_live_view_url
     )
-    print("Kernel browser live view url: ", kernel_browser.browser_live_view_url)
     #######################################
     # Your Browser Use implementation here
     #######################################
@@ -61,4 +94,4 @@ async def bu_task(ctx: kernel.KernelContext, input_data: TaskInput):
             return {"final_result": result.final_result()}
         return {"errors": result.errors()}
     finally:
-        client.browsers.delete_by_id(kernel_browser.session_id)
+        await asyncio.to_thread(client.browsers.delete_by_id, kernel_browser.session_id)
@@ -1,6 +1,27 @@
+import asyncio
+import logging
+import os
+import sys
+import weakref
+
 import kernel
 from kernel import Kernel
-from playwright.async_api import async_playwright
+from playwright.async_api import Browser, Playwright, async_playwright
+from playwright.async_api import Error as PlaywrightError
+
+# Use uvloop for the event loop Kernel creates when running this action, if available.
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# Log to stdout so messages show up in `kernel logs`. Only this module logs at
+# INFO; the root logger stays at WARNING so SDK request logs (httpx) stay quiet.
+logging.basicConfig(format="%(message)s", stream=sys.stdout)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
 
 client = Kernel()
 app = kernel.App("python-captcha-solver")
@@ -21,38 +42,120 @@ Invoke this via CLI:
 """
 
 
+# Playwright driver start per event loop; see _get_playwright
+_playwright_starts: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, "asyncio.Task[Playwright]"
+] = weakref.WeakKeyDictionary()
+
+
+async def _get_playwright() -> Playwright:
+    """
+    Return the Playwright driver for the running event loop, starting it on first use.
+
+    Spawning the driver takes a noticeable fraction of a second, so invocations
+    that share a loop share one driver. Kernel may also hand each invocation a
+    fresh loop; drivers of closed loops are dropped, which closes their pipes
+    and lets them exit.
+    """
+    for loop in [loop for loop in _playwright_starts if loop.is_closed()]:
+        del _playwright_starts[loop]
+
+    loop = asyncio.get_running_loop()
+    start = _playwright_starts.get(loop)
+    if start is None:
+        start = _playwright_starts[loop] = loop.create_task(async_playwright().start())
+    try:
+        # Shield the shared start so a cancelled invocation does not abort it
+        return await asyncio.shield(start)
+    except Exception:
+        _forget_playwright(start)
+        raise
+
+
+def _forget_playwright(start: "asyncio.Task[Playwright]") -> None:
+    """Drop a cached driver start so the next call on its loop starts a new one."""
+    loop = start.get_loop()
+    if _playwright_starts.get(loop) is start:
+        del _playwright_starts[loop]
+
+
+async def _connect_over_cdp(cdp_ws_url: str) -> Browser:
+    """
+    Connect to the Kernel browser over CDP.
+
+    A cached driver that has died fails every connection, so on failure the
+    loop's driver is dropped and the connection retried once on a new one.
+    The old driver is not stopped, as other invocations may still be using it.
+    """
+    playwright = await _get_playwright()
+    try:
+        return await playwright.chromium.connect_over_cdp(cdp_ws_url)
+    except PlaywrightError as e:
+        logger.warning("Connecting over CDP failed, restarting Playwright: %s", e)
+
+    start = _playwright_starts.get(asyncio.get_running_loop())
+    if (
+        start is not None
+        and start.done()
+        and not start.cancelled()
+        and start.exception() is None
+        and start.result() is playwright
+    ):
+        _forget_playwright(start)
+    playwright = await _get_playwright()
+    return await playwright.chromium.connect_over_cdp(cdp_ws_url)
+
+
 @app.action("test-captcha-solver")
 async def test_captcha_solver(ctx: kernel.KernelContext) -> None:
-    kernel_browser = client.browsers.create(
-        invocation_id=ctx.invocation_id,
-        stealth=True,
+    # Bring up Playwright while the Kernel browser is being created, and let
+    # both finish so neither is left dangling if the other fails
+    kernel_browser, playwright_ready = await asyncio.gather(
+        asyncio.to_thread(
+            client.browsers.create,
+            invocation_id=ctx.invocation_id,
+            stealth=True,
+        ),
+        _get_playwright(),
+        return_exceptions=True,
     )
+    if isinstance(kernel_browser, BaseException):
+        raise kernel_browser
 
+    browser = None
     try:
-        async with async_playwright() as playwright:
-            browser = await playwright.chromium.connect_over_cdp(
-                kernel_browser.cdp_ws_url
-            )
+        if isinstance(playwright_ready, BaseException):
+            raise playwright_ready
+        browser = await _connect_over_cdp(kernel_browser.cdp_ws_url)
 
-            # Get or create context and page
-            context = (
-                browser.contexts[0] if browser.contexts else await browser.new_context()
-            )
-            page = context.pages[0] if context.pages else await context.new_page()
+        # Kernel browsers always come up with a default context and page
+        assert browser.contexts, "Kernel browser must provide an initial context"
+        context = browser.contexts[0]
+        assert context.pages, "Kernel browser must provide an initial page"
+        page = context.pages[0]
 
-            # Access the live view. Retrieve this live_view_url from the Kernel logs in your CLI:
-            # kernel login  # or: export KERNEL_API_KEY=<Your API key>
-            # kernel logs python-captcha-solver --follow
-            print(
-                "Kernel browser live view url: ", kernel_browser.browser_live_view_url
-            )
+        # Access the live view. Retrieve this live_view_url from the Kernel logs in your CLI:
+        # kernel login  # or: export KERNEL_API_KEY=<Your API key>
+        # kernel logs python-captcha-solver --follow
+        logger.info(
+            "Kernel browser live view url: %s", kernel_browser.browser_live_view_url
+        )
 
-            # Navigate to a site with a CAPTCHA
-            await page.wait_for_timeout(
-                10000
-            )  # Add a delay to give you time to visit the live view url
-            await page.goto("https://www.google.com/recaptcha/api2/demo")
-            # Watch Kernel auto-solve the CAPTCHA!
-            await browser.close()
+        # The live view url above is reachable immediately. Set KERNEL_DEMO_MODE
+        # (kernel deploy main.py -e KERNEL_DEMO_MODE=1) to pause for 10 seconds
+        # first, giving you time to open it before the CAPTCHA page loads.
+        if os.getenv("KERNEL_DEMO_MODE"):
+            await page.wait_for_timeout(10000)
+
+        # Navigate to a site with a CAPTCHA
+        await page.goto("https://www.google.com/recaptcha/api2/demo")
+        # Watch Kernel auto-solve the CAPTCHA!
     finally:
-        client.browsers.delete_by_id(kernel_browser.session_id)
+        # The driver outlives this invocation, so always drop the CDP connection
+        try:
+            if browser is not None:
+                await browser.close()
+        finally:
+            await asyncio.to_thread(
+                client.browsers.delete_by_id, kernel_browser.session_id
+            )
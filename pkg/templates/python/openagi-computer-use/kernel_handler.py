@@ -5,6 +5,7 @@ Implements the AsyncActionHandler protocol using Kernel's Computer Controls API.
 """
 
 import asyncio
+import logging
 import time
 from typing import TYPE_CHECKING
 
@@ -19,6 +20,8 @@ from oagi.types.models.action import (
 if TYPE_CHECKING:
     from kernel_session import KernelBrowserSession
 
+logger = logging.getLogger(__name__)
+
 
 class KernelActionHandler:
     """
@@ -302,7 +305,7 @@ class KernelActionHandler:
 
             case ActionType.FINISH:
                 # Task completion - nothing to do
-                print("Task marked as finished")
+                logger.info("Task marked as finished")
 
             case ActionType.WAIT:
                 # Wait for specified duration
@@ -310,10 +313,10 @@ class KernelActionHandler:
 
             case ActionType.CALL_USER:
                 # Call user - implementation depends on requirements
-                print("User intervention requested")
+                logger.info("User intervention requested")
 
             case _:
-                print(f"Unknown action type: {action.type}")
+                logger.warning("Unknown action type: %s", action.type)
 
     def _execute_action(self, action: Action) -> None:
         """Execute an action, potentially multiple times."""
@@ -344,7 +347,7 @@ class KernelActionHandler:
                 # Pause between actions
                 await asyncio.sleep(self.action_pause)
             except Exception as e:
-                print(f"Error executing action {action.type}: {e}")
+                logger.error("Error executing action %s: %s", action.type, e)
                 raise
 
     def reset(self):
@@ -0,0 +1,20 @@
+"""
+Headless Module Mocks.
+
+oagi imports pyautogui and mouseinfo internally, which try to open an X11
+connection at import time. Kernel browsers are driven through
+KernelActionHandler instead, so empty stand-ins are enough.
+"""
+
+import sys
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+
+
+def install_headless_mocks() -> None:
+    """Register empty mouseinfo and pyautogui modules unless already imported."""
+    for name in ("mouseinfo", "pyautogui"):
+        if name not in sys.modules:
+            module = ModuleType(name)
+            module.__spec__ = ModuleSpec(name, None)
+            sys.modules[name] = module
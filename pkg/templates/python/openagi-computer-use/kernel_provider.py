@@ -4,6 +4,7 @@ Kernel Screenshot Provider.
 Implements the AsyncImageProvider protocol using Kernel's Computer Controls API.
 """
 
+import asyncio
 import io
 from typing import TYPE_CHECKING
 
@@ -90,7 +91,8 @@ class KernelScreenshotProvider:
             raise RuntimeError("Browser session not initialized")
 
         # Capture screenshot using Kernel Computer Controls API
-        response = self.session.kernel.browsers.computer.capture_screenshot(
+        response = await asyncio.to_thread(
+            self.session.kernel.browsers.computer.capture_screenshot,
             id=self.session.session_id
         )
 
@@ -6,11 +6,49 @@ with optional video replay recording.
 """
 
 import asyncio
+import logging
 import time
+from contextlib import ExitStack
 from dataclasses import dataclass
 from pathlib import Path
 
-from kernel import Kernel
+import httpx
+from kernel import APIResponse, APIStatusError, DefaultHttpxClient, Kernel
+
+# Keep idle connections to the Kernel API open between replay polls and
+# across invocations.
+_KERNEL_HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=32, keepalive_expiry=300
+)
+
+logger = logging.getLogger(__name__)
+
+# Returned by the replay download endpoint while the MP4 is still being produced
+_REPLAY_TOO_EARLY = 425
+
+_kernel_client: Kernel | None = None
+
+
+def _get_kernel() -> Kernel:
+    """
+    Return a Kernel client shared by all sessions in this process.
+
+    Created lazily so importing this module does not require KERNEL_API_KEY,
+    and reused so its connection pool survives across invocations.
+    """
+    global _kernel_client
+    if _kernel_client is None:
+        # Pass limits rather than a custom transport, which would make httpx
+        # ignore HTTP(S)_PROXY and NO_PROXY
+        _kernel_client = Kernel(
+            http_client=DefaultHttpxClient(limits=_KERNEL_HTTP_LIMITS),
+        )
+    return _kernel_client
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Delay before retry number `attempt` of a replay poll: 100ms doubling up to 2s."""
+    return min(0.1 * 2**attempt, 2.0)
 
 
 @dataclass
@@ -34,6 +72,7 @@ class KernelBrowserSession:
     replay_output_path: str = "replay.mp4"
     replay_framerate: int = 30
     replay_grace_period: float = 5.0  # Seconds to wait before stopping replay
+    replay_chunk_size: int = 1 << 20  # Bytes per chunk when saving the replay
 
     # Set after browser creation
     session_id: str | None = None
@@ -44,10 +83,11 @@ class KernelBrowserSession:
 
     async def __aenter__(self) -> "KernelBrowserSession":
         """Create a Kernel browser session and optionally start recording."""
-        self._kernel = Kernel()
+        self._kernel = _get_kernel()
 
         # Create browser with specified settings
-        browser = self._kernel.browsers.create(
+        browser = await asyncio.to_thread(
+            self._kernel.browsers.create,
             stealth=self.stealth,
             timeout_seconds=self.timeout_seconds,
         )
@@ -55,8 +95,8 @@ class KernelBrowserSession:
         self.session_id = browser.session_id
         self.live_view_url = browser.browser_live_view_url
 
-        print(f"Kernel browser created: {self.session_id}")
-        print(f"Live view URL: {self.live_view_url}")
+        logger.info("Kernel browser created: %s", self.session_id)
+        logger.info("Live view URL: %s", self.live_view_url)
 
         # Start replay recording if enabled
         if self.record_replay:
@@ -69,73 +109,142 @@ class KernelBrowserSession:
         if not self._kernel or not self.session_id:
             return
 
-        print("Starting replay recording...")
-        replay = self._kernel.browsers.replays.start(self.session_id)
+        logger.info("Starting replay recording...")
+        replay = await asyncio.to_thread(
+            self._kernel.browsers.replays.start, self.session_id
+        )
         self.replay_id = replay.replay_id
-        print(f"Replay recording started: {self.replay_id}")
+        logger.info("Replay recording started: %s", self.replay_id)
 
-    async def _stop_and_download_replay(self) -> None:
-        """Stop recording and download the replay as MP4."""
+    async def _stop_replay(self) -> None:
+        """Stop recording the replay."""
         if not self._kernel or not self.session_id or not self.replay_id:
             return
 
-        print("Stopping replay recording...")
-        self._kernel.browsers.replays.stop(
+        logger.info("Stopping replay recording...")
+        await asyncio.to_thread(
+            self._kernel.browsers.replays.stop,
             replay_id=self.replay_id,
             id=self.session_id,
         )
-        print("Replay recording stopped. Processing video...")
+        logger.info("Replay recording stopped. Processing video...")
 
-        # Wait a moment for processing
-        await asyncio.sleep(2)
+    async def _replay_listed(self) -> bool:
+        """Check whether the replay is listed for the session, recording its view URL."""
+        replays = await asyncio.to_thread(
+            self._kernel.browsers.replays.list, self.session_id
+        )
+        for replay in replays:
+            if replay.replay_id == self.replay_id:
+                self.replay_view_url = replay.replay_view_url
+                return True
+        return False
+
+    def _open_replay(self) -> tuple[ExitStack, APIResponse]:
+        """
+        Request the replay download and return the open streaming response.
+
+        Returns:
+            The response and an ExitStack that closes it
+        """
+        with ExitStack() as stack:
+            response = stack.enter_context(
+                self._kernel.browsers.replays.with_streaming_response.download(
+                    replay_id=self.replay_id,
+                    id=self.session_id,
+                )
+            )
+            return stack.pop_all(), response
 
-        # Poll for replay to be ready (with timeout)
-        max_wait = 60  # seconds
-        start_time = time.time()
-        replay_ready = False
+    def _save_replay(self, stack: ExitStack, response: APIResponse) -> None:
+        """Stream the replay to replay_output_path in fixed-size chunks."""
+        # Ensure output directory exists
+        output_path = Path(self.replay_output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        while time.time() - start_time < max_wait:
+        # Stream the body straight to disk rather than buffering the whole MP4,
+        # and only move it into place once it is complete
+        partial_path = output_path.with_name(output_path.name + ".part")
+        try:
+            with stack, partial_path.open("wb") as f:
+                for chunk in response.iter_bytes(self.replay_chunk_size):
+                    f.write(chunk)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+        partial_path.replace(output_path)
+
+    async def _wait_until_ready(self, deadline: float) -> tuple[ExitStack, APIResponse]:
+        """
+        Request the replay download, retrying with exponential backoff while it is processed.
+
+        A replay that is still processing is not yet in the session's replay
+        list (the readiness signal this template has always polled). A 404 from
+        the download is only retried while that is the case; if the replay is
+        already listed, or the list call fails because the session is gone, the
+        error is raised. 425 Too Early is always retried.
+
+        Raises:
+            TimeoutError: If the replay is still processing at the deadline
+        """
+        attempt = 0
+        while True:
             try:
-                replays = self._kernel.browsers.replays.list(self.session_id)
-                for replay in replays:
-                    if replay.replay_id == self.replay_id:
-                        self.replay_view_url = replay.replay_view_url
-                        replay_ready = True
-                        break
-                if replay_ready:
-                    break
-            except Exception:
-                pass
-            await asyncio.sleep(1)
-
-        if not replay_ready:
-            print("Warning: Replay may still be processing")
-
-        # Download the replay
-        print(f"Downloading replay to {self.replay_output_path}...")
+                return await asyncio.to_thread(self._open_replay)
+            except APIStatusError as e:
+                if e.status_code == 404:
+                    if await self._replay_listed():
+                        raise
+                elif e.status_code != _REPLAY_TOO_EARLY:
+                    raise
+            # Check the deadline between attempts rather than cancelling one
+            # midway, which would leave its worker thread running
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError
+            await asyncio.sleep(min(_backoff_delay(attempt), remaining))
+            attempt += 1
+
+    async def _download_replay(self, deadline: float) -> bool:
+        """
+        Wait for the stopped replay to finish processing and download it as MP4.
+
+        Only the wait is bounded by the deadline; once the replay is ready, the
+        download runs to completion however large the recording is.
+
+        Returns:
+            True if the replay was saved to replay_output_path
+        """
+        logger.info("Downloading replay to %s...", self.replay_output_path)
         try:
-            video_data = self._kernel.browsers.replays.download(
-                replay_id=self.replay_id,
-                id=self.session_id,
-            )
-
-            # Read the content and save to file
-            content = video_data.read()
-
-            # Ensure output directory exists
-            output_path = Path(self.replay_output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(output_path, "wb") as f:
-                f.write(content)
-
-            print(f"Replay saved to {self.replay_output_path}")
+            stack, response = await self._wait_until_ready(deadline)
+            await asyncio.to_thread(self._save_replay, stack, response)
+        except TimeoutError:
+            logger.warning("Replay may still be processing")
+            return False
+        except Exception as e:
+            logger.error("Error downloading replay: %s", e)
+            return False
 
-            if self.replay_view_url:
-                print(f"Replay view URL: {self.replay_view_url}")
+        logger.info("Replay saved to %s", self.replay_output_path)
+        return True
 
+    async def _lookup_replay_view_url(self) -> None:
+        """Find the view URL of the saved replay in the session's replay list."""
+        # The replay is listed by the time it can be downloaded
+        try:
+            if await self._replay_listed():
+                logger.info("Replay view URL: %s", self.replay_view_url)
+            else:
+                logger.warning("Replay view URL not available yet")
         except Exception as e:
-            print(f"Error downloading replay: {e}")
+            logger.error("Error looking up replay view URL: %s", e)
+
+    async def _delete_browser(self) -> None:
+        """Delete the browser session."""
+        logger.info("Destroying browser session: %s", self.session_id)
+        await asyncio.to_thread(self._kernel.browsers.delete_by_id, self.session_id)
+        logger.info("Browser session destroyed.")
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Stop recording, download replay, and delete the browser session."""
@@ -144,17 +253,22 @@ class KernelBrowserSession:
             if self.record_replay and self.replay_id:
                 # Wait grace period before stopping to capture final state
                 if self.replay_grace_period > 0:
-                    print(f"Waiting {self.replay_grace_period}s grace period...")
+                    logger.info("Waiting %ss grace period...", self.replay_grace_period)
                     await asyncio.sleep(self.replay_grace_period)
-                await self._stop_and_download_replay()
+                await self._stop_replay()
+
+                max_wait = 60  # seconds
+                deadline = time.monotonic() + max_wait
+
+                # Replay endpoints are addressed by session id, so keep the browser
+                # alive until the MP4 is saved and its view URL is known.
+                if await self._download_replay(deadline):
+                    await self._lookup_replay_view_url()
 
-            print(f"Destroying browser session: {self.session_id}")
-            self._kernel.browsers.delete_by_id(self.session_id)
-            print("Browser session destroyed.")
+            await self._delete_browser()
 
         self.session_id = None
         self.replay_id = None
-        self._kernel = None
 
     @property
     def kernel(self) -> Kernel:
@@ -1,19 +1,14 @@
+import asyncio
+import logging
 import os
 import sys
-from types import ModuleType
-from importlib.machinery import ModuleSpec
+import weakref
 
 # Mock pyautogui and mouseinfo to prevent X11 connection at import time.
-# oagi imports these modules internally, but we use KernelActionHandler instead,
-# so pyautogui functionality is never actually needed.
-mock_mouseinfo = ModuleType("mouseinfo")
-mock_mouseinfo.__spec__ = ModuleSpec("mouseinfo", None)
+# This must run before oagi is imported below.
+from kernel_mocks import install_headless_mocks
 
-mock_pyautogui = ModuleType("pyautogui")
-mock_pyautogui.__spec__ = ModuleSpec("pyautogui", None)
-
-sys.modules["mouseinfo"] = mock_mouseinfo
-sys.modules["pyautogui"] = mock_pyautogui
+install_headless_mocks()
 
 # Load local env vars from a .env file when running locally.
 # In deployed environments this is typically a no-op.
@@ -33,6 +28,14 @@ from kernel_handler import KernelActionHandler
 
 from oagi import AsyncDefaultAgent, TaskerAgent
 
+# Log through a single stdout handler so messages show up in `kernel logs`.
+# Only the template's own loggers log at INFO; the root logger stays at WARNING
+# so SDK request logs (httpx) for every screenshot and action stay quiet.
+logging.basicConfig(format="%(message)s", stream=sys.stdout)
+for _name in (__name__, "kernel_session", "kernel_handler"):
+    logging.getLogger(_name).setLevel(logging.INFO)
+logger = logging.getLogger(__name__)
+
 """
 Example app that runs agents using OpenAGI's Lux computer-use models.
 
@@ -53,6 +56,9 @@ Invoke via CLI:
 
     # TaskerAgent example:
     kernel invoke python-openagi-cua openagi-tasker-task -p '{"task":"Navigate to OAGI homepage","todos":["Go to https://agiopen.org","Click on What is Computer Use"]}'
+
+    # TaskerAgent with independent workflows, each run concurrently in its own browser:
+    kernel invoke python-openagi-cua openagi-tasker-task -p '{"task":"Read the OAGI sites","parallel_todos":[["Go to https://agiopen.org"],["Go to https://developer.agiopen.org/docs"]]}'
 """
 
 
@@ -65,6 +71,8 @@ class DefaultAgentInput(TypedDict):
 class TaskerAgentInput(TypedDict):
     task: str
     todos: List[str]
+    # Independent todo lists, each run by its own agent and browser concurrently
+    parallel_todos: Optional[List[List[str]]]
     record_replay: Optional[bool]
 
 
@@ -74,13 +82,66 @@ class AgentOutput(TypedDict):
     replay_url: Optional[str]
 
 
+class TaskerAgentOutput(AgentOutput):
+    replay_urls: Optional[List[Optional[str]]]
+
+
+# Use uvloop for the event loop Kernel creates when running actions, if available.
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 api_key = os.getenv("OAGI_API_KEY")
 if not api_key:
     raise ValueError("OAGI_API_KEY is not set")
 
+base_url = os.getenv("OAGI_BASE_URL", "https://api.agiopen.org")
+
+# Cap how many browser sessions (and agents) run at once on an event loop; the
+# rest wait for a free slot.
+_max_concurrent_env = os.getenv("OAGI_MAX_CONCURRENT", "4").strip()
+if not _max_concurrent_env.isdecimal() or int(_max_concurrent_env) < 1:
+    raise ValueError("OAGI_MAX_CONCURRENT must be a positive integer")
+max_concurrent = int(_max_concurrent_env)
+
+# One session limiter per event loop; see _session_slots
+_session_slots_by_loop: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
 app = App("python-openagi-cua")
 
 
+def _use_eager_tasks() -> None:
+    """Run new tasks eagerly up to their first await (Python 3.12+ only)."""
+    factory = getattr(asyncio, "eager_task_factory", None)
+    loop = asyncio.get_running_loop()
+    if factory is not None and loop.get_task_factory() is None:
+        loop.set_task_factory(factory)
+
+
+def _session_slots() -> asyncio.Semaphore:
+    """
+    Return the session limiter for the running event loop, creating it on first use.
+
+    Kernel may run invocations on a shared loop or hand each a fresh one, and a
+    semaphore can only be used on one loop, so every loop gets its own.
+    """
+    # A semaphore keeps a reference to its loop once contended, so drop the
+    # entries of closed loops rather than waiting for the weak keys to die
+    for loop in [loop for loop in _session_slots_by_loop if loop.is_closed()]:
+        del _session_slots_by_loop[loop]
+
+    loop = asyncio.get_running_loop()
+    slots = _session_slots_by_loop.get(loop)
+    if slots is None:
+        slots = _session_slots_by_loop[loop] = asyncio.Semaphore(max_concurrent)
+    return slots
+
+
 @app.action("openagi-default-task")
 async def oagi_default_task(
     ctx: KernelContext,
@@ -96,6 +157,8 @@ async def oagi_default_task(
     Returns:
         AgentOutput with success status and result message
     """
+    _use_eager_tasks()
+
     if not payload or not payload.get("instruction"):
         raise ValueError("instruction is required")
 
@@ -103,8 +166,16 @@ async def oagi_default_task(
     model = payload.get("model", "lux-actor-1")
     record_replay = payload.get("record_replay", False)
 
-    async with KernelBrowserSession(record_replay=record_replay) as session:
-        print("Kernel browser live view url:", session.live_view_url)
+    # Name the replay after the invocation so concurrent invocations on this
+    # worker do not overwrite each other's recordings
+    async with (
+        _session_slots(),
+        KernelBrowserSession(
+            record_replay=record_replay,
+            replay_output_path=f"replay-{ctx.invocation_id}.mp4",
+        ) as session,
+    ):
+        logger.info("Kernel browser live view url: %s", session.live_view_url)
 
         provider = KernelScreenshotProvider(session)
         handler = KernelActionHandler(session)
@@ -115,7 +186,7 @@ async def oagi_default_task(
             model=model,
         )
 
-        print(f"\nExecuting task: {instruction}\n")
+        logger.info("Executing task: %s", instruction)
         success = await agent.execute(
             instruction=instruction,
             action_handler=handler,
@@ -130,46 +201,39 @@ async def oagi_default_task(
     }
 
 
-@app.action("openagi-tasker-task")
-async def oagi_tasker_task(
-    ctx: KernelContext,
-    payload: TaskerAgentInput,
-) -> AgentOutput:
+async def _run_tasker(
+    task: str,
+    todos: List[str],
+    record_replay: bool,
+    replay_output_path: str,
+) -> tuple[bool, Optional[str]]:
     """
-    Execute a structured task using OpenAGI's TaskerAgent with predefined steps.
-
-    Args:
-        ctx: Kernel context containing invocation information
-        payload: Contains 'task' (str) and 'todos' (list of str steps)
+    Run a TaskerAgent over the given todos in a browser session of its own.
 
     Returns:
-        AgentOutput with success status and result message
+        The agent's success status and the replay view URL, if recorded
     """
-    if not payload or not payload.get("task"):
-        raise ValueError("task is required")
-
-    if not payload.get("todos") or not isinstance(payload["todos"], list):
-        raise ValueError("todos must be a non-empty list of steps")
-
-    task = payload["task"]
-    todos = payload["todos"]
-    record_replay = payload.get("record_replay", False)
-
-    async with KernelBrowserSession(record_replay=record_replay) as session:
-        print("Kernel browser live view url:", session.live_view_url)
+    async with (
+        _session_slots(),
+        KernelBrowserSession(
+            record_replay=record_replay,
+            replay_output_path=replay_output_path,
+        ) as session,
+    ):
+        logger.info("Kernel browser live view url: %s", session.live_view_url)
 
         provider = KernelScreenshotProvider(session)
         handler = KernelActionHandler(session)
 
         agent = TaskerAgent(
             api_key=api_key,
-            base_url=os.getenv("OAGI_BASE_URL", "https://api.agiopen.org"),
+            base_url=base_url,
         )
 
         agent.set_task(task=task, todos=todos)
 
-        print(f"\nExecuting task: {task}")
-        print(f"Steps: {todos}\n")
+        logger.info("Executing task: %s", task)
+        logger.info("Steps: %s", todos)
 
         success = await agent.execute(
             instruction="",
@@ -178,8 +242,82 @@ async def oagi_tasker_task(
         )
 
     # After context exits, replay_view_url is available if recording was enabled
+    return success, session.replay_view_url
+
+
+@app.action("openagi-tasker-task")
+async def oagi_tasker_task(
+    ctx: KernelContext,
+    payload: TaskerAgentInput,
+) -> TaskerAgentOutput:
+    """
+    Execute a structured task using OpenAGI's TaskerAgent with predefined steps.
+
+    Each list in 'parallel_todos' is a workflow: its steps run in order in one
+    browser, so later steps can build on earlier ones. A single browser can only
+    be driven by one agent at a time, so each workflow gets its own agent and
+    browser session, and the workflows run concurrently. Use it for workflows
+    that do not depend on each other.
+
+    Args:
+        ctx: Kernel context containing invocation information
+        payload: Contains 'task' (str) and either 'todos' (list of str steps)
+            or 'parallel_todos' (list of independent step lists)
+
+    Returns:
+        TaskerAgentOutput with success status, result message, and replay URLs
+    """
+    _use_eager_tasks()
+
+    if not payload or not payload.get("task"):
+        raise ValueError("task is required")
+
+    task = payload["task"]
+    record_replay = payload.get("record_replay", False)
+    parallel_todos = payload.get("parallel_todos")
+
+    if parallel_todos is not None:
+        if (
+            not isinstance(parallel_todos, list)
+            or not parallel_todos
+            or not all(isinstance(todos, list) and todos for todos in parallel_todos)
+        ):
+            raise ValueError(
+                "parallel_todos must be a non-empty list of non-empty step lists"
+            )
+
+        results = await asyncio.gather(
+            *(
+                _run_tasker(
+                    task, todos, record_replay, f"replay-{ctx.invocation_id}-{i}.mp4"
+                )
+                for i, todos in enumerate(parallel_todos)
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        success = all(ok for ok, _ in results)
+        return {
+            "success": success,
+            "result": f"TaskerAgent completed {len(results)} parallel workflows. Task: {task}. Success: {success}",
+            "replay_url": None,
+            "replay_urls": [replay_url for _, replay_url in results],
+        }
+
+    if not payload.get("todos") or not isinstance(payload["todos"], list):
+        raise ValueError("todos must be a non-empty list of steps")
+
+    todos = payload["todos"]
+    success, replay_url = await _run_tasker(
+        task, todos, record_replay, f"replay-{ctx.invocation_id}.mp4"
+    )
+
     return {
         "success": success,
         "result": f"TaskerAgent completed. Task: {task}. Success: {success}",
-        "replay_url": session.replay_view_url,
+        "replay_url": replay_url,
+        "replay_urls": None,
     }
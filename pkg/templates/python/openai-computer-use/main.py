@@ -1,6 +1,8 @@
 import asyncio
 import datetime
+import logging
 import os
+import sys
 from typing import TypedDict
 
 import kernel
@@ -31,28 +33,88 @@ class CuaOutput(TypedDict):
     result: str
 
 
+# Use uvloop for the event loop Kernel creates when running actions, if available.
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 api_key = os.getenv("OPENAI_API_KEY")
 if not api_key:
     raise ValueError("OPENAI_API_KEY is not set")
 
+# Log to stdout so messages show up in `kernel logs`. Only this module logs at
+# INFO; the root logger stays at WARNING so SDK request logs (httpx) stay quiet.
+logging.basicConfig(format="%(message)s", stream=sys.stdout)
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
 client = Kernel()
 app = kernel.App("python-openai-cua")
 
 
+def _use_eager_tasks() -> None:
+    """Run new tasks eagerly up to their first await (Python 3.12+ only)."""
+    factory = getattr(asyncio, "eager_task_factory", None)
+    loop = asyncio.get_running_loop()
+    if factory is not None and loop.get_task_factory() is None:
+        loop.set_task_factory(factory)
+
+
+# Additional tools to provide to the agent, shared by every invocation
+AGENT_TOOLS: list[dict] = []
+
+
+def _acknowledge_safety_check(message: str) -> bool:
+    # safety check function, now defaults to true
+    logger.info("> agent : safety check message (skipping): %s", message)
+    return True
+
+
+def _make_agent(computer: KernelPlaywrightBrowser) -> Agent:
+    """Build an agent for the given computer from the shared tools and safety callback."""
+    return Agent(
+        computer=computer,
+        # Agent appends its computer tools in place, so hand it a fresh copy
+        tools=list(AGENT_TOOLS),
+        acknowledge_safety_check_callback=_acknowledge_safety_check,
+    )
+
+
 @app.action("cua-task")
 async def cua_task(
     ctx: kernel.KernelContext,
     payload: CuaInput,
 ) -> CuaOutput:
     # A function that processes a user task using the kernel browser and agent
+    _use_eager_tasks()
 
     if not payload or not payload.get("task"):
         raise ValueError("task is required")
 
-    kernel_browser = await asyncio.to_thread(
-        client.browsers.create, invocation_id=ctx.invocation_id, stealth=True
+    # Start creating the browser and prepare the agent input while it spins up
+    browser_task = asyncio.create_task(
+        asyncio.to_thread(
+            client.browsers.create, invocation_id=ctx.invocation_id, stealth=True
+        )
+    )
+
+    # messages to provide to the agent
+    now = datetime.datetime.now(datetime.timezone.utc)
+    items = [
+        {
+            "role": "system",
+            "content": f"- Current date and time: {now.isoformat()} ({now.strftime('%A')})",
+        },
+        {"role": "user", "content": payload["task"]},
+    ]
+
+    kernel_browser = await browser_task
+    logger.info(
+        "Kernel browser live view url: %s", kernel_browser.browser_live_view_url
     )
-    print("Kernel browser live view url: ", kernel_browser.browser_live_view_url)
     cdp_ws_url = kernel_browser.cdp_ws_url
 
     def run_agent():
@@ -60,24 +122,8 @@ async def cua_task(
             # Navigate to DuckDuckGo as starting page (less likely to trigger captchas than Google)
             computer.goto("https://duckduckgo.com")
 
-            # messages to provide to the agent
-            items = [
-                {
-                    "role": "system",
-                    "content": f"- Current date and time: {datetime.datetime.utcnow().isoformat()} ({datetime.datetime.utcnow().strftime('%A')})",
-                },
-                {"role": "user", "content": payload["task"]},
-            ]
-
             # setup the agent
-            agent = Agent(
-                computer=computer,
-                tools=[],  # can provide additional tools to the agent
-                acknowledge_safety_check_callback=lambda message: (
-                    print(f"> agent : safety check message (skipping): {message}")
-                    or True
-                ),  # safety check function , now defaults to true
-            )
+            agent = _make_agent(computer)
 
             # run the agent
             response_items = agent.run_full_turn(